@@ -13,16 +13,22 @@ Example:
 from __future__ import annotations
 
 import argparse
+import fnmatch
+import os
+import re
 import shutil
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
 class ProjectScaffolder:
-    def __init__(self, template_dir: Path):
-        self.template_dir = template_dir
-        self.exclude_files: set[str] = {
+    PARALLEL_COPY_THRESHOLD = 4
+
+    EXCLUDE_FILES: frozenset[str] = frozenset(
+        {
             ".git",
             ".venv_workflows",
             "__pycache__",
@@ -58,7 +64,9 @@ class ProjectScaffolder:
             "*.bak",
             "*.backup",
         }
-        self.exclude_dirs: set[str] = {
+    )
+    EXCLUDE_DIRS: frozenset[str] = frozenset(
+        {
             ".git",
             ".venv_workflows",
             "__pycache__",
@@ -73,44 +81,86 @@ class ProjectScaffolder:
             ".tox",
             ".nox",
         }
+    )
+    KEEP_HIDDEN: frozenset[str] = frozenset({".vscode", ".gitignore"})
+    # One alternation of all glob patterns, matched against entry names.
+    _EXCLUDE_RE = re.compile(
+        "|".join(fnmatch.translate(p) for p in sorted(EXCLUDE_FILES | EXCLUDE_DIRS))
+    )
+
+    def __init__(self, template_dir: Path):
+        self.template_dir = template_dir
 
     def should_exclude(self, path: Path) -> bool:
         """Check if a path should be excluded from copying."""
-        path_str = str(path)
-
-        if path.name in self.exclude_files:
+        name = path.name
+        if self._EXCLUDE_RE.match(name):
             return True
-
-        for exclude_dir in self.exclude_dirs:
-            if exclude_dir in path_str:
-                return True
-
-        return path.name.startswith(".") and path.name not in [".vscode", ".gitignore"]
+        return name.startswith(".") and name not in self.KEEP_HIDDEN
 
     def copy_template(self, dest_dir: Path) -> None:
         """Copy template files to destination directory."""
         print(f"Copying template to {dest_dir}")
 
-        for src_path in self.template_dir.rglob("*"):
-            if self.should_exclude(src_path):
+        # Walk with os.scandir so excluded directories are pruned instead of
+        # descended into, and file types come from the cached DirEntry data.
+        pending = [str(self.template_dir)]
+        copies: list[tuple[str, Path, Path, int]] = []
+        messages: list[str] = []
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError as e:
+                messages.append(f"  Failed to read {current}: {e}")
                 continue
 
-            rel_path = src_path.relative_to(self.template_dir)
+            for entry in entries:
+                src_path = Path(entry.path)
+                if self.should_exclude(src_path):
+                    continue
 
-            if rel_path.name == "scaffold.py":
-                continue
+                rel_path = src_path.relative_to(self.template_dir)
 
-            dest_path = dest_dir / rel_path
+                if entry.name == "scaffold.py":
+                    continue
 
-            try:
-                if src_path.is_file():
-                    dest_path.parent.mkdir(parents=True, exist_ok=True)
-                    shutil.copy2(src_path, dest_path)
-                    print(f"  Copied: {rel_path}")
-                elif src_path.is_dir():
-                    dest_path.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                print(f"  Failed to copy {rel_path}: {e}")
+                dest_path = dest_dir / rel_path
+
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        dest_path.mkdir(parents=True, exist_ok=True)
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        copies.append((entry.path, dest_path, rel_path, entry.stat().st_mode))
+                except Exception as e:
+                    print(f"  Failed to copy {rel_path}: {e}")
+
+        # Directories already exist, so the independent file copies can run
+        # concurrently; small templates are not worth the pool start-up.
+        if len(copies) > self.PARALLEL_COPY_THRESHOLD:
+            workers = min(32, (os.cpu_count() or 1) * 4)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                messages.extend(pool.map(lambda job: self._copy_file(*job), copies))
+        else:
+            messages.extend(self._copy_file(*job) for job in copies)
+        for message in messages:
+            print(message)
+
+    @staticmethod
+    def _copy_file(src: str, dest_path: Path, rel_path: Path, mode: int) -> str:
+        """Copy a single file and return the progress line to report.
+
+        Only contents and permission bits are copied (``copyfile`` can use
+        ``copy_file_range``/``sendfile``); timestamps are not preserved.
+        """
+        try:
+            shutil.copyfile(src, dest_path)
+            dest_path.chmod(stat.S_IMODE(mode))
+        except Exception as e:
+            return f"  Failed to copy {rel_path}: {e}"
+        return f"  Copied: {rel_path}"
 
     def customize_project(self, dest_dir: Path, project_name: str) -> None:
         """Customize the copied project with the new project name."""
@@ -123,19 +173,35 @@ class ProjectScaffolder:
             dest_dir / "README.md",
             dest_dir / "src" / "mcp_workflows" / "__init__.py",
             dest_dir / "Makefile",
+            dest_dir / "setup.py",
         ]
 
+        # All names are ASCII, so one bytes-level pass covers every replacement
+        # without a decode/encode round trip.
+        replacements = {
+            b"MCP Workflows": project_name.title().encode(),
+            b"mcp-workflows": project_name.lower().encode(),
+            b"mcp_workflows": package_name.encode(),
+        }
+        pattern = re.compile(b"|".join(re.escape(old) for old in replacements))
+
         for file_path in files_to_update:
-            if file_path.exists():
-                try:
-                    content = file_path.read_text()
-                    content = content.replace("MCP Workflows", project_name.title())
-                    content = content.replace("mcp-workflows", project_name.lower())
-                    content = content.replace("mcp_workflows", package_name)
-                    file_path.write_text(content)
-                    print(f"  Updated: {file_path.relative_to(dest_dir)}")
-                except Exception as e:
-                    print(f"  Failed to update {file_path}: {e}")
+            # A single read/write handle doubles as the existence check, and
+            # files without any match are left untouched.
+            try:
+                with file_path.open("r+b") as handle:
+                    content = handle.read()
+                    updated = pattern.sub(lambda m: replacements[m.group(0)], content)
+                    if updated == content:
+                        continue
+                    handle.seek(0)
+                    handle.write(updated)
+                    handle.truncate()
+                print(f"  Updated: {file_path.relative_to(dest_dir)}")
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                print(f"  Failed to update {file_path}: {e}")
 
         old_package_dir = dest_dir / "src" / "mcp_workflows"
         new_package_dir = dest_dir / "src" / package_name
@@ -151,9 +217,41 @@ class ProjectScaffolder:
         """Set up the new project (git init, venv, install deps)."""
         print("Setting up project...")
 
+        venv_dir = dest_dir / ".venv"
+        # Git setup and venv creation are independent, so run them side by
+        # side; only the dependency install has to wait for the venv.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            git_done = pool.submit(self._init_git, dest_dir)
+            venv_created = pool.submit(self._create_venv, venv_dir)
+            git_done.result()
+            if not venv_created.result():
+                return
+
+        pip_path = venv_dir / "bin" / "pip"
+        if pip_path.exists():
+            try:
+                subprocess.run(
+                    [str(pip_path), "install", "-e", ".[dev]"],
+                    cwd=dest_dir,
+                    check=True,
+                    capture_output=True,
+                )
+                print("  Dependencies installed")
+            except subprocess.CalledProcessError as e:
+                print(f"  Dependency installation failed: {e}")
+
+    @staticmethod
+    def _init_git(dest_dir: Path) -> None:
+        """Initialize the repository and commit the scaffolded files."""
         try:
             subprocess.run(["git", "init"], cwd=dest_dir, check=True, capture_output=True)
-            subprocess.run(["git", "add", "."], cwd=dest_dir, check=True, capture_output=True)
+            # The venv is being created concurrently; never stage it.
+            subprocess.run(
+                ["git", "add", "--", ".", ":(exclude).venv"],
+                cwd=dest_dir,
+                check=True,
+                capture_output=True,
+            )
             subprocess.run(
                 [
                     "git",
@@ -169,26 +267,16 @@ class ProjectScaffolder:
         except subprocess.CalledProcessError as e:
             print(f"  Git setup failed: {e}")
 
-        venv_dir = dest_dir / ".venv"
+    @staticmethod
+    def _create_venv(venv_dir: Path) -> bool:
+        """Create the project virtual environment, returning ``True`` on success."""
         try:
             subprocess.run([sys.executable, "-m", "venv", str(venv_dir)], check=True, capture_output=True)
-            print("  Virtual environment created")
         except subprocess.CalledProcessError as e:
             print(f"  Virtual environment creation failed: {e}")
-            return
-
-        pip_path = venv_dir / "bin" / "pip"
-        if pip_path.exists():
-            try:
-                subprocess.run(
-                    [str(pip_path), "install", "-e", ".[dev]"],
-                    cwd=dest_dir,
-                    check=True,
-                    capture_output=True,
-                )
-                print("  Dependencies installed")
-            except subprocess.CalledProcessError as e:
-                print(f"  Dependency installation failed: {e}")
+            return False
+        print("  Virtual environment created")
+        return True
 
     def scaffold(self, project_name: str, dest_dir: Path | None) -> Path:
         """Main scaffolding method."""
@@ -0,0 +1,22 @@
+"""Optional native build for the template module.
+
+By default this is a regular pure-Python build driven by ``pyproject.toml``.
+Setting ``MCP_WORKFLOWS_MYPYC=1`` compiles ``mcp_workflows.templates`` with
+mypyc instead; mypy and types-PyYAML must then be importable in the build
+environment (see ``make native``). The pure-Python module remains the
+fallback wherever no compiled build is installed.
+"""
+
+from __future__ import annotations
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("MCP_WORKFLOWS_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["src/mcp_workflows/templates.py"])
+
+setup(ext_modules=ext_modules)
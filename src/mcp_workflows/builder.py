@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
@@ -10,30 +11,53 @@ import yaml
 
 from .spec import Branch, StepKind, StepSpec, TaskSpec, WorkflowSpec
 
+# Prefer the libyaml-backed dumper; fall back to the pure Python emitter.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+@dataclass(frozen=True, slots=True)
+class BuilderState:
+    """Immutable snapshot of the configuration collected by a builder."""
+
+    goal: str | None = None
+    memory_file: str | None = None
+    tasks: tuple[TaskSpec, ...] = ()
+    steps: tuple[StepSpec, ...] = ()
+
 
 class WorkflowBuilder:
-    """Incrementally assemble a :class:`WorkflowSpec`."""
+    """Incrementally assemble a :class:`WorkflowSpec`.
+
+    Builders are immutable: every configuration method returns a new builder and
+    leaves the receiver untouched, so a partially configured builder can be
+    shared as a common prefix between workflow variants.
+    """
+
+    __slots__ = ("_dict_cache", "_spec_cache", "_state", "_task_ids")
 
-    def __init__(self) -> None:
-        self._goal: str | None = None
-        self._memory_file: str | None = None
-        self._tasks: dict[str, TaskSpec] = {}
-        self._steps: list[StepSpec] = []
+    def __init__(self, state: BuilderState | None = None) -> None:
+        self._state = state if state is not None else BuilderState()
+        self._task_ids = frozenset(task.id for task in self._state.tasks)
+        self._spec_cache: WorkflowSpec | None = None
+        self._dict_cache: dict[str, Any] | None = None
 
     @classmethod
     def start(cls) -> WorkflowBuilder:
         """Create a new builder instance."""
         return cls()
 
+    @property
+    def state(self) -> BuilderState:
+        """Return the immutable configuration held by this builder."""
+        return self._state
+
     def with_goal(self, goal: str) -> WorkflowBuilder:
         """Set the primary goal for the workflow."""
-        self._goal = goal
-        return self
+        return self._evolve(goal=goal)
 
     def memory(self, path: str | Path) -> WorkflowBuilder:
         """Configure the memory file path used during execution."""
-        self._memory_file = str(path)
-        return self
+        return self._evolve(memory_file=str(path))
 
     def register_task(
         self,
@@ -43,12 +67,14 @@ class WorkflowBuilder:
         text: str | None = None,
     ) -> WorkflowBuilder:
         """Register a reusable task document."""
-        if task_id in self._tasks:
+        if task_id in self._task_ids:
             msg = f"Task '{task_id}' is already registered."
             raise ValueError(msg)
         task = TaskSpec(id=task_id, file=str(file) if file else None, text=text)
-        self._tasks[task_id] = task
-        return self
+        return self._evolve(
+            tasks=(*self._state.tasks, task),
+            task_ids=self._task_ids | {task_id},
+        )
 
     def add_step(
         self,
@@ -63,29 +89,27 @@ class WorkflowBuilder:
         next_step: int | None = None,
     ) -> WorkflowBuilder:
         """Append a new step definition to the workflow."""
-        step_id = len(self._steps) + 1
-        uses_list = list(uses) if uses else []
-        for task_id in uses_list:
-            if task_id not in self._tasks:
-                msg = f"Step '{name}' references unknown task '{task_id}'."
-                raise ValueError(msg)
-        branch_models: list[Branch] = []
-        if branches:
-            for branch in branches:
-                branch_models.append(self._coerce_branch(branch))
+        step_id = len(self._state.steps) + 1
+        # Build tuples up front so StepSpec's tuple() normalisation is a no-op.
+        uses_tuple = tuple(uses) if uses else ()
+        unknown = set(uses_tuple).difference(self._task_ids)
+        if unknown:
+            missing = ", ".join(repr(task_id) for task_id in sorted(unknown))
+            msg = f"Step '{name}' references unknown tasks: {missing}."
+            raise ValueError(msg)
+        branch_models = tuple(map(self._coerce_branch, branches)) if branches else ()
         step = StepSpec(
             id=step_id,
             name=name,
             kind=kind,
             doc=doc,
-            uses=uses_list,
+            uses=uses_tuple,
             input_template=input_template,
             config=config or {},
             branches=branch_models,
             next_step=next_step,
         )
-        self._steps.append(step)
-        return self
+        return self._evolve(steps=(*self._state.steps, step))
 
     def end(self) -> WorkflowBuilder:
         """Finalize step additions (no-op placeholder for fluent API)."""
@@ -93,37 +117,77 @@ class WorkflowBuilder:
 
     def compile(self) -> WorkflowSpec:
         """Produce the immutable :class:`WorkflowSpec`."""
-        if not self._goal:
+        if self._spec_cache is not None:
+            return self._spec_cache
+        state = self._state
+        if not state.goal:
             msg = "Workflow goal must be provided before compilation."
             raise ValueError(msg)
-        if not self._memory_file:
+        if not state.memory_file:
             msg = "Memory file must be configured before compilation."
             raise ValueError(msg)
-        return WorkflowSpec(
-            goal=self._goal,
-            memory_file=self._memory_file,
-            tasks=list(self._tasks.values()),
-            steps=list(self._steps),
+        self._spec_cache = WorkflowSpec(
+            goal=state.goal,
+            memory_file=state.memory_file,
+            tasks=state.tasks,
+            steps=state.steps,
         )
+        return self._spec_cache
 
     def emit_yaml(self, path: str | Path, *, sort_keys: bool = False) -> Path:
         """Compile the workflow and write it as YAML to ``path``."""
-        spec = self.compile()
+        data = self._serialized()
         output_path = Path(path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        data = spec.as_dict()
-        yaml_text = yaml.safe_dump(
+        # Let the emitter produce UTF-8 bytes directly instead of building the
+        # whole document as a str first. Serializing before the file is opened
+        # leaves an existing file intact when the data cannot be represented.
+        yaml_bytes = yaml.dump(
             data,
+            Dumper=_YAML_DUMPER,
+            encoding="utf-8",
             sort_keys=sort_keys,
             default_flow_style=False,
             allow_unicode=True,
         )
-        output_path.write_text(yaml_text, encoding="utf-8")
+        output_path.write_bytes(yaml_bytes)
         return output_path
 
+    def _serialized(self) -> dict[str, Any]:
+        """Return the compiled spec's :meth:`~WorkflowSpec.as_dict`, computed once.
+
+        Builders are immutable, so the payload never goes stale. It is kept here
+        rather than on the spec so the spec's dataclass fields stay untouched,
+        and it is only handed to the YAML emitter, never to callers.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self.compile().as_dict()
+        return self._dict_cache
+
+    def _evolve(
+        self,
+        *,
+        task_ids: frozenset[str] | None = None,
+        **changes: Any,
+    ) -> WorkflowBuilder:
+        """Return a new builder whose state has ``changes`` applied.
+
+        The task-id index is carried over (or extended by the caller) instead
+        of being rebuilt from the task tuple for every derived builder.
+        """
+        builder = object.__new__(type(self))
+        builder._state = replace(self._state, **changes)
+        builder._task_ids = self._task_ids if task_ids is None else task_ids
+        builder._spec_cache = None
+        builder._dict_cache = None
+        return builder
+
     @staticmethod
     def _coerce_branch(branch: Branch | dict[str, Any]) -> Branch:
         """Normalize branch definitions into :class:`Branch` instances."""
         if isinstance(branch, Branch):
             return branch
         return Branch(**branch)
+
+
+__all__ = ["BuilderState", "WorkflowBuilder"]
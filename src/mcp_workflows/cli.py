@@ -3,13 +3,15 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import sys
 from collections.abc import Sequence
 from pathlib import Path
 
 from .builder import WorkflowBuilder
 from .orchestrator import WorkflowOrchestrator
 from .tasks import DESIGN_MD, IMPLEMENTATION_MD, REQUIREMENTS_MD, TESTING_MD
-from .templates import create_workflow_from_template
+from .templates import WorkflowTemplate, create_workflow_from_template
 
 DEFAULT_GOAL = "Write production-ready code for the specified task"
 
@@ -19,15 +21,20 @@ def run_code_workflow(workflow_name: str, goal: str, workflow_folder: Path) -> N
 
     memory_file = workflow_folder / "memory.md"
     builder = create_code_workflow_builder(workflow_name)
-    builder._goal = goal  # Override the default goal
-    builder._memory_file = str(memory_file)
-    spec = builder.compile()
+    spec = builder.with_goal(goal).memory(memory_file).compile()
     WorkflowOrchestrator(spec).run()
 
 
 def create_code_workflow_builder(workflow_name: str) -> WorkflowBuilder:
     """Create a builder for a multi-step code writing workflow."""
 
+    return _code_workflow_builder()
+
+
+@functools.cache
+def _code_workflow_builder() -> WorkflowBuilder:
+    """Build the canned code workflow once; builders are immutable, so it is shared."""
+
     return (
         WorkflowBuilder.start()
         .with_goal("Write production-ready code for the specified task")
@@ -59,18 +66,40 @@ def create_code_workflow_builder(workflow_name: str) -> WorkflowBuilder:
     )
 
 
-def build_code_workflow(workflow_name: str) -> Path:
-    """Create a complete code workflow in its own folder using templates."""
+def build_code_workflow(workflow_name: str, base_path: Path | None = None) -> Path:
+    """Create a complete code workflow in its own folder using templates.
 
-    from .templates import WorkflowTemplate
+    The folder is created under ``base_path``, defaulting to ``workflows``
+    relative to the current directory.
+    """
 
     template = WorkflowTemplate(workflow_name)
-    return create_workflow_from_template(template, Path("workflows"))
+    return create_workflow_from_template(template, base_path or Path("workflows"))
 
 
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Parse command line arguments for the workflow builder."""
 
+    args = sys.argv[1:] if argv is None else argv
+    return _fast_parse(args) or _get_parser().parse_args(args)
+
+
+def _fast_parse(argv: Sequence[str]) -> argparse.Namespace | None:
+    """Handle the common ``NAME`` and ``--run NAME`` forms without argparse."""
+
+    args = list(argv)
+    run = bool(args) and args[0] == "--run"
+    if run:
+        args = args[1:]
+    if len(args) != 1 or args[0].startswith("-"):
+        return None
+    return argparse.Namespace(goal=DEFAULT_GOAL, run=run, name=args[0])
+
+
+@functools.cache
+def _get_parser() -> argparse.ArgumentParser:
+    """Build the argument parser once and reuse it across invocations."""
+
     parser = argparse.ArgumentParser(description="Create and run code writing workflows.")
     parser.add_argument(
         "--goal",
@@ -86,7 +115,7 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         "name",
         help="Name of the workflow to create in workflows/NAME/ folder",
     )
-    return parser.parse_args(argv)
+    return parser
 
 
 def main(argv: Sequence[str] | None = None) -> int:
@@ -6,6 +6,8 @@ from typing import Protocol
 
 from .spec import StepRequest, StepResponse
 
+_LLM_SUFFIX = " :: synthesized response"
+
 
 class Executor(Protocol):
     """Protocol describing a component capable of running a workflow step."""
@@ -17,11 +19,12 @@ class Executor(Protocol):
 class LLMExecutor:
     """Return canned responses for language model steps."""
 
+    __slots__ = ()
+
     def execute(self, request: StepRequest) -> StepResponse:
         """Produce a deterministic response for the orchestrator."""
 
-        message = f"{request.name} :: synthesized response"
-        result = {"message": message, "echo": request.input}
+        result = {"message": request.name + _LLM_SUFFIX, "echo": request.input}
         return StepResponse(status="ok", result=result, quality="good")
 
 
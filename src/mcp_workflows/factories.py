@@ -2,28 +2,33 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
-from dataclasses import dataclass
 from typing import Any, cast
 
 from .executors import Executor, LLMExecutor
 from .spec import StepKind
 
-
-@dataclass(slots=True)
-class _Provider:
-    """Internal descriptor storing provider metadata."""
-
-    factory: Callable[["ServiceContainer"], Any]
-    singleton: bool
+_EXECUTOR_NAMESPACE = "executor"
+# Container keys per step kind, built once instead of formatted on every call.
+_EXECUTOR_KEYS: dict[StepKind, str] = {
+    kind: f"{_EXECUTOR_NAMESPACE}:{kind.value}" for kind in StepKind
+}
 
 
 class ServiceContainer:
-    """Minimalistic dependency injection container."""
+    """Minimalistic dependency injection container.
+
+    Every registration is stored as a zero-argument thunk in a single mapping.
+    Singleton thunks replace themselves with a constant thunk after the first
+    resolution, so lookups cost one dictionary probe and one call.
+    """
 
     def __init__(self) -> None:
-        self._providers: dict[str, _Provider] = {}
-        self._singletons: dict[str, Any] = {}
+        self._entries: dict[str, Callable[[], Any]] = {}
+        # Lazy builder for each singleton key (``None`` for pre-built
+        # instances) so cached values can be discarded again.
+        self._singletons: dict[str, Callable[[], Any] | None] = {}
 
     def register_factory(
         self,
@@ -34,7 +39,7 @@ class ServiceContainer:
     ) -> None:
         """Register ``factory`` to create new instances for ``key`` each request."""
 
-        self._set_provider(key, _Provider(factory=factory, singleton=False), override)
+        self._set_entry(key, functools.partial(factory, self), override)
 
     def register_singleton(
         self,
@@ -45,53 +50,66 @@ class ServiceContainer:
     ) -> None:
         """Register ``factory`` producing a singleton instance for ``key``."""
 
-        self._set_provider(key, _Provider(factory=factory, singleton=True), override)
+        def build() -> Any:
+            instance = factory(self)
+            self._entries[key] = lambda: instance
+            return instance
+
+        self._set_entry(key, build, override)
+        self._singletons[key] = build
 
     def register_instance(self, key: str, instance: Any, *, override: bool = False) -> None:
         """Register a pre-built ``instance`` as a singleton for ``key``."""
 
-        if not override and self.is_registered(key):
-            msg = f"Service '{key}' is already registered"
-            raise ValueError(msg)
-        self._providers.pop(key, None)
-        self._singletons[key] = instance
+        self._set_entry(key, lambda: instance, override)
+        self._singletons[key] = None
 
     def resolve(self, key: str) -> Any:
         """Return the dependency associated with ``key``."""
 
-        if key in self._singletons:
-            return self._singletons[key]
-        provider = self._providers.get(key)
-        if provider is None:
+        try:
+            thunk = self._entries[key]
+        except KeyError:
             msg = f"Service '{key}' has not been registered"
-            raise LookupError(msg)
-        instance = provider.factory(self)
-        if provider.singleton:
-            self._singletons[key] = instance
-        return instance
+            raise LookupError(msg) from None
+        return thunk()
 
     def is_registered(self, key: str) -> bool:
         """Return ``True`` if ``key`` exists in the container."""
 
-        return key in self._providers or key in self._singletons
+        return key in self._entries
+
+    def is_singleton(self, key: str) -> bool:
+        """Return ``True`` if ``key`` resolves to one shared instance."""
+
+        return key in self._singletons
 
     def clear_singletons(self) -> None:
         """Discard cached singleton instances (useful for deterministic tests)."""
 
-        self._singletons.clear()
-
-    def _set_provider(self, key: str, provider: _Provider, override: bool) -> None:
-        if not override and self.is_registered(key):
+        for key, build in self._singletons.items():
+            if build is None:
+                del self._entries[key]
+            else:
+                self._entries[key] = build
+        self._singletons = {
+            key: build for key, build in self._singletons.items() if build is not None
+        }
+
+    def _set_entry(self, key: str, thunk: Callable[[], Any], override: bool) -> None:
+        if override:
+            self._entries[key] = thunk
+        elif self._entries.setdefault(key, thunk) is not thunk:
+            # setdefault doubles as the registration check: one probe, not two.
             msg = f"Service '{key}' is already registered"
             raise ValueError(msg)
         self._singletons.pop(key, None)
-        self._providers[key] = provider
 
 
 class ExecutorFactory:
     """Factory responsible for supplying executors for workflow steps."""
 
-    _NAMESPACE = "executor"
+    __slots__ = ("_container",)
 
     def __init__(self, container: ServiceContainer | None = None) -> None:
         self._container = container or ServiceContainer()
@@ -120,7 +138,11 @@ class ExecutorFactory:
         *,
         override: bool = False,
     ) -> None:
-        """Register ``builder`` whose result is cached and reused for ``kind``."""
+        """Register ``builder`` whose result is cached and reused for ``kind``.
+
+        The executor is only constructed on the first ``create(kind)``, so
+        kinds that no step uses never build theirs.
+        """
 
         self._container.register_singleton(self._key(kind), builder, override=override)
 
@@ -150,6 +172,11 @@ class ExecutorFactory:
 
         return self._container.is_registered(self._key(kind))
 
+    def is_singleton(self, kind: StepKind) -> bool:
+        """Return ``True`` if every ``create(kind)`` call yields the same executor."""
+
+        return self._container.is_singleton(self._key(kind))
+
     @classmethod
     def default(cls) -> "ExecutorFactory":
         """Create a factory seeded with the default LLM executor."""
@@ -159,7 +186,7 @@ class ExecutorFactory:
         return factory
 
     def _key(self, kind: StepKind) -> str:
-        return f"{self._NAMESPACE}:{kind.value}"
+        return _EXECUTOR_KEYS[kind]
 
 
 __all__ = ["ExecutorFactory", "ServiceContainer"]
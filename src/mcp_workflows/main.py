@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import sys
-from typing import Sequence
+from typing import TYPE_CHECKING
 
 from .cli import main as cli_main
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 def main(argv: Sequence[str] | None = None) -> None:
     """Delegate execution to the CLI module."""
@@ -3,16 +3,35 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .executors import Executor, LLMExecutor
 from .factories import ExecutorFactory
 from .hooks import StepObserver
-from .spec import StepKind, StepRequest, StepResponse, WorkflowSpec
+from .spec import StepKind, StepRequest, StepResponse, StepSpec, WorkflowSpec
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def _noop(*_args: object) -> None:
+    """Stand-in observer callback used when no observer is attached."""
 
 
 class WorkflowOrchestrator:
     """Drive workflow execution using registered executors."""
 
+    __slots__ = (
+        "_memory_path",
+        "_observer",
+        "_on_error",
+        "_on_finish",
+        "_on_start",
+        "_step_templates",
+        "executor_factory",
+        "spec",
+    )
+
     def __init__(
         self,
         spec: WorkflowSpec,
@@ -22,6 +41,9 @@ class WorkflowOrchestrator:
         executor_factory: ExecutorFactory | None = None,
     ) -> None:
         self.spec = spec
+        self._on_start: Callable[..., None]
+        self._on_finish: Callable[..., None]
+        self._on_error: Callable[..., None]
         self.observer = observer
         factory = executor_factory or ExecutorFactory.default()
         if executors:
@@ -31,31 +53,81 @@ class WorkflowOrchestrator:
             factory.register_singleton(StepKind.LLM, lambda _: LLMExecutor())
         self.executor_factory = factory
         self._memory_path = Path(spec.memory_file)
+        # Request fields that depend only on the step: (step, correlation id, input).
+        self._step_templates: list[tuple[StepSpec, str, str]] = [
+            (step, f"step-{step.id}", step.input_template or "") for step in spec.steps
+        ]
+
+    @property
+    def observer(self) -> StepObserver | None:
+        """Observer notified of step lifecycle events, if any."""
+
+        return self._observer
+
+    @observer.setter
+    def observer(self, observer: StepObserver | None) -> None:
+        # Bind the callbacks once so the step loop calls them without branching.
+        self._observer = observer
+        if observer is not None:
+            self._on_start = observer.on_step_start
+            self._on_finish = observer.on_step_finish
+            self._on_error = observer.on_step_error
+        else:
+            self._on_start = self._on_finish = self._on_error = _noop
 
     def run(self) -> list[StepResponse]:
-        """Execute each step in order and persist summary output."""
+        """Execute each step in order and persist summary output.
+
+        Executors are resolved when a step first needs them. Singleton and
+        instance registrations are then reused for the rest of the run, while
+        kinds registered with a factory get a fresh executor for every step.
+        """
 
         responses: list[StepResponse] = []
-        for step in self.spec.steps:
-            request = StepRequest(
-                step_id=step.id,
-                name=step.name,
-                kind=step.kind,
-                correlation_id=f"step-{step.id}",
-                input=step.input_template or "",
-                memory_text=self._read_memory(),
-                config=step.config,
-            )
-            self._notify_start(request)
-            executor = self.executor_factory.create(step.kind)
-            response = executor.execute(request)
-            responses.append(response)
-            if response.status == "fail":
-                self._notify_error(request, response)
-                self._append_memory(self._format_error(step.name, response))
-                break
-            self._notify_finish(request, response)
-            self._append_memory(self._format_summary(step.name, response))
+        if not self.spec.steps:
+            return responses
+        resolved: dict[StepKind, Executor] = {}
+        create = self.executor_factory.create
+        is_singleton = self.executor_factory.is_singleton
+        # The file only grows by the lines written below, so read it once and
+        # extend the in-memory copy instead of re-reading it for every step.
+        memory_text = self._read_memory()
+        # Bind loop invariants to locals so each step avoids attribute lookups.
+        notify_start = self._on_start
+        notify_finish = self._on_finish
+        notify_error = self._on_error
+        format_summary = self._format_summary
+        format_error = self._format_error
+        record = responses.append
+        self._memory_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._memory_path.open("a", encoding="utf-8") as memory:
+            write = memory.write
+            for step, correlation_id, step_input in self._step_templates:
+                request = StepRequest(
+                    step_id=step.id,
+                    name=step.name,
+                    kind=step.kind,
+                    correlation_id=correlation_id,
+                    input=step_input,
+                    memory_text=memory_text,
+                    config=step.config,
+                )
+                notify_start(request)
+                executor = resolved.get(step.kind)
+                if executor is None:
+                    executor = create(step.kind)
+                    if is_singleton(step.kind):
+                        resolved[step.kind] = executor
+                response = executor.execute(request)
+                record(response)
+                if response.status == "fail":
+                    notify_error(request, response)
+                    write(f"{format_error(step.name, response)}\n")
+                    break
+                notify_finish(request, response)
+                line = f"{format_summary(step.name, response)}\n"
+                write(line)
+                memory_text += line
         return responses
 
     def _read_memory(self) -> str:
@@ -63,16 +135,12 @@ class WorkflowOrchestrator:
             return ""
         return self._memory_path.read_text(encoding="utf-8")
 
-    def _append_memory(self, line: str) -> None:
-        self._memory_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._memory_path.open("a", encoding="utf-8") as handle:
-            handle.write(f"{line}\n")
-
     def _format_summary(self, step_name: str, response: StepResponse) -> str:
         result = response.result
-        if isinstance(result, dict):
-            message = result.get("message") or str(result)
-        else:
+        # Mapping-like results expose .get; anything else falls back to str().
+        get = getattr(result, "get", None)
+        message = get("message") if get is not None else None
+        if not message:
             message = str(result)
         return f"- {step_name}: {message}"
 
@@ -81,17 +149,5 @@ class WorkflowOrchestrator:
         detail = response.error or "unknown error"
         return f"- {step_name}: failed ({detail})"
 
-    def _notify_start(self, request: StepRequest) -> None:
-        if self.observer:
-            self.observer.on_step_start(request)
-
-    def _notify_finish(self, request: StepRequest, response: StepResponse) -> None:
-        if self.observer:
-            self.observer.on_step_finish(request, response)
-
-    def _notify_error(self, request: StepRequest, response: StepResponse) -> None:
-        if self.observer:
-            self.observer.on_step_error(request, response)
-
 
 __all__ = ["WorkflowOrchestrator"]
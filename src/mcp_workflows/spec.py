@@ -2,9 +2,15 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Literal
+from typing import TYPE_CHECKING, Any, Literal
+
+import yaml
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator, Mapping
 
 
 class StepKind(str, Enum):
@@ -15,6 +21,61 @@ class StepKind(str, Enum):
     PYTHON = "python"
 
 
+# Plain string per kind, so serialization skips the enum ``value`` descriptor.
+_KIND_VALUES: dict[StepKind, str] = {kind: kind.value for kind in StepKind}
+
+
+def _ensure_tuple(instance: object, name: str) -> None:
+    """Coerce a frozen dataclass field to a tuple unless it already is one."""
+
+    value = getattr(instance, name)
+    if not isinstance(value, tuple):
+        object.__setattr__(instance, name, tuple(value))
+
+
+class _FrozenConfig(dict[str, Any]):
+    """Read-only ``dict`` holding step configuration.
+
+    Unlike ``MappingProxyType`` it pickles, deep-copies, survives
+    ``dataclasses.asdict`` and safe-dumps to YAML, so specs and requests can
+    cross process boundaries.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *_args: Any, **_kwargs: Any) -> Any:
+        msg = "Step configuration is read-only."
+        raise TypeError(msg)
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self) -> tuple[type[_FrozenConfig], tuple[dict[str, Any]]]:
+        return (type(self), (dict(self),))
+
+
+def _represent_kind(dumper: yaml.representer.SafeRepresenter, kind: StepKind) -> yaml.Node:
+    return dumper.represent_str(_KIND_VALUES[kind])
+
+
+# PyYAML's safe representers match exact types only; emit frozen configs as
+# plain mappings and step kinds as their values, so safe_dump() handles
+# specs passed through dataclasses.asdict. SafeDumper and CSafeDumper share
+# SafeRepresenter's table.
+yaml.representer.SafeRepresenter.add_representer(
+    _FrozenConfig, yaml.representer.SafeRepresenter.represent_dict
+)
+yaml.representer.SafeRepresenter.add_representer(StepKind, _represent_kind)
+
+
+def _freeze_config(config: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only copy of ``config``, copying only if not already frozen."""
+
+    if isinstance(config, _FrozenConfig):
+        return config
+    return _FrozenConfig(config)
+
+
 @dataclass(frozen=True, slots=True)
 class Branch:
     """Conditional jump instruction evaluated after a step completes."""
@@ -46,71 +107,76 @@ class BaseTask:
     expected_output: str = ""
     success_criteria: tuple[str, ...] = field(default_factory=tuple)
 
+    @property
+    def task_spec(self) -> TaskSpec:
+        """The :class:`TaskSpec` for this task, rendered once and then shared."""
+
+        return _render_task_spec(self)
+
     def to_task_spec(self, task_dir: str = "tasks") -> TaskSpec:
         """Convert to a TaskSpec that can be used in workflows."""
-        task_content = self._generate_task_content()
-        return TaskSpec(id=self.name, text=task_content)
+        return self.task_spec
 
     def _generate_task_content(self) -> str:
         """Generate the complete task content for this base task."""
-        content_parts = [
-            f"# {self.name}",
-            "## Objective",
-            f"{self.objective}",
-            "",
-            "## Description",
-            f"{self.description}",
-        ]
-
-        if self.prerequisites:
-            content_parts.extend([
-                "",
-                "## Prerequisites",
-                *[f"- {prereq}" for prereq in self.prerequisites]
-            ])
-
-        if self.sites_to_visit:
-            content_parts.extend([
-                "",
-                "## Resources",
-                *[f"- {site}" for site in self.sites_to_visit]
-            ])
-
-        if self.substeps:
-            content_parts.extend([
-                "",
-                "## Substeps",
-                *[f"- {step}" for step in self.substeps]
-            ])
-
-        content_parts.extend([
-            "",
-            "## Instructions",
-            f"{self.instructions}",
-        ])
-
-        if self.expected_output:
-            content_parts.extend([
-                "",
-                "## Expected Output",
-                f"{self.expected_output}"
-            ])
-
-        if self.success_criteria:
-            content_parts.extend([
-                "",
-                "## Success Criteria",
-                *[f"- {criteria}" for criteria in self.success_criteria]
-            ])
-
-        return "\n".join(content_parts)
+        return "\n".join(_task_content_lines(self))
 
     def __post_init__(self) -> None:
         # Convert lists to tuples for immutability
-        object.__setattr__(self, "sites_to_visit", tuple(self.sites_to_visit))
-        object.__setattr__(self, "substeps", tuple(self.substeps))
-        object.__setattr__(self, "prerequisites", tuple(self.prerequisites))
-        object.__setattr__(self, "success_criteria", tuple(self.success_criteria))
+        _ensure_tuple(self, "sites_to_visit")
+        _ensure_tuple(self, "substeps")
+        _ensure_tuple(self, "prerequisites")
+        _ensure_tuple(self, "success_criteria")
+
+
+def _task_content_lines(task: BaseTask) -> Iterator[str]:
+    """Yield the task document line by line, skipping empty sections."""
+    yield f"# {task.name}"
+    yield "## Objective"
+    yield task.objective
+    yield ""
+    yield "## Description"
+    yield task.description
+
+    if task.prerequisites:
+        yield ""
+        yield "## Prerequisites"
+        for prereq in task.prerequisites:
+            yield f"- {prereq}"
+
+    if task.sites_to_visit:
+        yield ""
+        yield "## Resources"
+        for site in task.sites_to_visit:
+            yield f"- {site}"
+
+    if task.substeps:
+        yield ""
+        yield "## Substeps"
+        for step in task.substeps:
+            yield f"- {step}"
+
+    yield ""
+    yield "## Instructions"
+    yield task.instructions
+
+    if task.expected_output:
+        yield ""
+        yield "## Expected Output"
+        yield task.expected_output
+
+    if task.success_criteria:
+        yield ""
+        yield "## Success Criteria"
+        for criteria in task.success_criteria:
+            yield f"- {criteria}"
+
+
+# Keyed by value, so equal task definitions share one rendered TaskSpec; the
+# cache lives outside the dataclass so fields() and asdict() never see it.
+@functools.lru_cache(maxsize=256)
+def _render_task_spec(task: BaseTask) -> TaskSpec:
+    return TaskSpec(id=task.name, text="\n".join(_task_content_lines(task)))
 
 
 @dataclass(frozen=True, slots=True)
@@ -147,14 +213,14 @@ class StepSpec:
     doc: str = ""
     uses: tuple[str, ...] = field(default_factory=tuple)
     input_template: str | None = None
-    config: dict[str, Any] = field(default_factory=dict)
+    config: Mapping[str, Any] = field(default_factory=dict)
     branches: tuple[Branch, ...] = field(default_factory=tuple)
     next_step: int | None = None
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "uses", tuple(self.uses))
-        object.__setattr__(self, "branches", tuple(self.branches))
-        object.__setattr__(self, "config", dict(self.config))
+        _ensure_tuple(self, "uses")
+        _ensure_tuple(self, "branches")
+        object.__setattr__(self, "config", _freeze_config(self.config))
 
     def as_dict(self) -> dict[str, Any]:
         """Serialize the step for persistence."""
@@ -162,7 +228,7 @@ class StepSpec:
         payload: dict[str, Any] = {
             "id": self.id,
             "name": self.name,
-            "kind": self.kind.value,
+            "kind": _KIND_VALUES[self.kind],
             "doc": self.doc,
         }
         if self.uses:
@@ -178,6 +244,17 @@ class StepSpec:
         return payload
 
 
+def _ensure_unique_ids(kind: str, ids: Iterable[Hashable]) -> None:
+    """Raise on the first repeated identifier, naming the offending id."""
+
+    seen: set[Hashable] = set()
+    for item_id in ids:
+        if item_id in seen:
+            msg = f"WorkflowSpec {kind} must have unique identifiers; duplicate {item_id!r}."
+            raise ValueError(msg)
+        seen.add(item_id)
+
+
 @dataclass(frozen=True, slots=True)
 class WorkflowSpec:
     """Top-level contract describing a full workflow."""
@@ -188,16 +265,10 @@ class WorkflowSpec:
     steps: tuple[StepSpec, ...] = field(default_factory=tuple)
 
     def __post_init__(self) -> None:
-        object.__setattr__(self, "tasks", tuple(self.tasks))
-        object.__setattr__(self, "steps", tuple(self.steps))
-        task_ids = {task.id for task in self.tasks}
-        if len(task_ids) != len(self.tasks):
-            msg = "WorkflowSpec tasks must have unique identifiers."
-            raise ValueError(msg)
-        step_ids = {step.id for step in self.steps}
-        if len(step_ids) != len(self.steps):
-            msg = "WorkflowSpec steps must have unique identifiers."
-            raise ValueError(msg)
+        _ensure_tuple(self, "tasks")
+        _ensure_tuple(self, "steps")
+        _ensure_unique_ids("tasks", (task.id for task in self.tasks))
+        _ensure_unique_ids("steps", (step.id for step in self.steps))
 
     def as_dict(self) -> dict[str, Any]:
         """Serialize the workflow for persistence."""
@@ -220,7 +291,10 @@ class StepRequest:
     correlation_id: str
     input: Any
     memory_text: str
-    config: dict[str, Any] = field(default_factory=dict)
+    config: Mapping[str, Any] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "config", _freeze_config(self.config))
 
 
 @dataclass(frozen=True, slots=True)
@@ -236,4 +310,16 @@ class StepResponse:
 
     def __post_init__(self) -> None:
         if self.artifacts is not None:
-            object.__setattr__(self, "artifacts", tuple(self.artifacts))
+            _ensure_tuple(self, "artifacts")
+
+
+__all__ = [
+    "BaseTask",
+    "Branch",
+    "StepKind",
+    "StepRequest",
+    "StepResponse",
+    "StepSpec",
+    "TaskSpec",
+    "WorkflowSpec",
+]
@@ -2,23 +2,182 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from pathlib import Path
-from typing import Dict
+import functools
+from dataclasses import dataclass, replace
+from pathlib import Path, PurePath
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
 from .spec import BaseTask, StepKind, StepSpec, TaskSpec
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+# libyaml's emitter produces the same documents several times faster.
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+
+# Paths of the default workflow structure, sorted once for the README listing.
+# The README is itself part of the structure, so it cannot be derived from it.
+_DEFAULT_PATHS: tuple[str, ...] = tuple(
+    sorted(
+        (
+            "workflow.yaml",
+            "README.md",
+            "memory.md",
+            "memory/",
+            "tasks/",
+            "config/",
+            "config/steps.yaml",
+            "logs/",
+            "results/",
+        )
+    )
+)
+
+_DEFAULT_PATH_BULLETS = "\n".join(f"- {path}" for path in _DEFAULT_PATHS)
+
+_DEFAULT_MEMORY = b"# Workflow Memory\n\nSession memory for workflow execution."
+
+
+def _dump_yaml(data: Any) -> str:
+    """Serialize ``data`` as YAML, preserving key order."""
+    return yaml.dump(data, Dumper=_YAML_DUMPER, sort_keys=False, allow_unicode=True)
+
+
+# Default step and task definitions, shared by every template that does not
+# override them.
+_DEFAULT_STEPS: tuple[StepSpec, ...] = (
+    StepSpec(
+        id=1,
+        name="Gather Requirements",
+        kind=StepKind.LLM,
+        doc="Collect and analyze all requirements for the coding task",
+        uses=("requirements",),
+    ),
+    StepSpec(
+        id=2,
+        name="Design Solution",
+        kind=StepKind.LLM,
+        doc="Plan the architecture and approach for implementation",
+        uses=("requirements", "design"),
+    ),
+    StepSpec(
+        id=3,
+        name="Implement Code",
+        kind=StepKind.LLM,
+        doc="Write the actual code following the design plan",
+        uses=("design", "implement"),
+    ),
+    StepSpec(
+        id=4,
+        name="Test and Review",
+        kind=StepKind.LLM,
+        doc="Test the code, review for quality, and suggest improvements",
+        uses=("implement", "test"),
+    ),
+)
 
-@dataclass
+_DEFAULT_BASE_TASKS: tuple[BaseTask, ...] = (
+    BaseTask(
+        name="requirements",
+        objective="Gather and clarify all requirements for the coding task",
+        description="Collect functional requirements, constraints, input/output specifications, and understand success criteria",
+        substeps=(
+            "Identify functional requirements",
+            "Identify constraints and edge cases",
+            "Clarify input/output specifications",
+            "Note dependencies and prerequisites",
+        ),
+        instructions="Analyze the task requirements thoroughly. Consider all possible inputs, edge cases, and success criteria.",
+        expected_output="Complete requirements specification ready for design phase",
+        success_criteria=(
+            "All functional requirements documented",
+            "Constraints and edge cases identified",
+            "Input/output specifications clear",
+            "Dependencies documented",
+        ),
+    ),
+    BaseTask(
+        name="design",
+        objective="Design the solution architecture and approach",
+        description="Plan the solution structure, algorithms, data flow, interfaces, and error handling approach",
+        prerequisites=("Requirements gathered",),
+        substeps=(
+            "Design solution structure and architecture",
+            "Plan algorithms and data flow",
+            "Define interfaces and modules",
+            "Consider error handling approach",
+        ),
+        instructions="Create a comprehensive design that addresses all requirements while considering maintainability, scalability, and error conditions.",
+        expected_output="Complete design specification ready for implementation",
+        success_criteria=(
+            "Solution structure defined",
+            "Algorithms and data flow planned",
+            "Interfaces designed",
+            "Error handling considered",
+        ),
+    ),
+    BaseTask(
+        name="implement",
+        objective="Implement production-ready code following best practices",
+        description="Write clean, readable, well-structured code that follows language conventions and handles errors properly",
+        prerequisites=("Design completed",),
+        substeps=(
+            "Write clean, readable code",
+            "Follow language best practices",
+            "Add meaningful comments",
+            "Handle exceptions properly",
+        ),
+        sites_to_visit=(
+            "https://peps.python.org/pep-0008/",  # For Python
+            "https://docs.oracle.com/javase/tutorial/java/nutsandbolts/index.html",  # For Java
+            "https://developer.mozilla.org/en-US/docs/Web/JavaScript",  # For JS
+        ),
+        instructions="Implement the code following the design specifications. Add comprehensive error handling, logging, and documentation.",
+        expected_output="Production-ready code implementation",
+        success_criteria=(
+            "Code is clean and readable",
+            "Follows language best practices",
+            "Errors are properly handled",
+            "Code is well-documented",
+        ),
+    ),
+    BaseTask(
+        name="test",
+        objective="Test code thoroughly and ensure quality",
+        description="Write unit tests, test edge cases, error conditions, and verify the implementation meets all requirements",
+        prerequisites=("Code implemented",),
+        substeps=(
+            "Write unit tests for key functions",
+            "Test edge cases and error conditions",
+            "Review code for bugs and optimization",
+            "Suggest improvements",
+        ),
+        instructions="Create comprehensive tests covering normal operation, edge cases, and error conditions. Verify all requirements are met.",
+        expected_output="Thoroughly tested code with identified issues addressed",
+        success_criteria=(
+            "Unit tests written for key functions",
+            "Edge cases and errors tested",
+            "Code reviewed for quality",
+            "Improvement suggestions provided",
+        ),
+    ),
+)
+
+
+@dataclass(slots=True)
 class WorkflowTemplate:
     """Template defining the structure and contents of a workflow."""
 
     name: str
 
-    # Folder structure: path -> content or None (for directories)
-    structure: Dict[str, str | None] = field(default_factory=dict)
+    # Folder structure: path -> content or None (for directories); generated
+    # content is stored pre-encoded as UTF-8 bytes. Left as None, the default
+    # structure is generated.
+    structure: Mapping[str, str | bytes | None] | None = None
 
     # Goal statement for the workflow
     goal: str = "Write production-ready code for the specified task"
@@ -27,145 +186,36 @@ class WorkflowTemplate:
     memory_file: str = "memory.md"
 
     # Steps definitions using proper models
-    steps: list[StepSpec] = field(default_factory=lambda: [
-        StepSpec(
-            id=1,
-            name="Gather Requirements",
-            kind=StepKind.LLM,
-            doc="Collect and analyze all requirements for the coding task",
-            uses=("requirements",)
-        ),
-        StepSpec(
-            id=2,
-            name="Design Solution",
-            kind=StepKind.LLM,
-            doc="Plan the architecture and approach for implementation",
-            uses=("requirements", "design")
-        ),
-        StepSpec(
-            id=3,
-            name="Implement Code",
-            kind=StepKind.LLM,
-            doc="Write the actual code following the design plan",
-            uses=("design", "implement")
-        ),
-        StepSpec(
-            id=4,
-            name="Test and Review",
-            kind=StepKind.LLM,
-            doc="Test the code, review for quality, and suggest improvements",
-            uses=("implement", "test")
-        ),
-    ])
+    steps: tuple[StepSpec, ...] = _DEFAULT_STEPS
 
     # BaseTask definitions using proper models
-    base_tasks: list[BaseTask] = field(default_factory=lambda: [
-        BaseTask(
-            name="requirements",
-            objective="Gather and clarify all requirements for the coding task",
-            description="Collect functional requirements, constraints, input/output specifications, and understand success criteria",
-            substeps=(
-                "Identify functional requirements",
-                "Identify constraints and edge cases",
-                "Clarify input/output specifications",
-                "Note dependencies and prerequisites",
-            ),
-            instructions="Analyze the task requirements thoroughly. Consider all possible inputs, edge cases, and success criteria.",
-            expected_output="Complete requirements specification ready for design phase",
-            success_criteria=(
-                "All functional requirements documented",
-                "Constraints and edge cases identified",
-                "Input/output specifications clear",
-                "Dependencies documented",
-            ),
-        ),
-        BaseTask(
-            name="design",
-            objective="Design the solution architecture and approach",
-            description="Plan the solution structure, algorithms, data flow, interfaces, and error handling approach",
-            prerequisites=("Requirements gathered",),
-            substeps=(
-                "Design solution structure and architecture",
-                "Plan algorithms and data flow",
-                "Define interfaces and modules",
-                "Consider error handling approach",
-            ),
-            instructions="Create a comprehensive design that addresses all requirements while considering maintainability, scalability, and error conditions.",
-            expected_output="Complete design specification ready for implementation",
-            success_criteria=(
-                "Solution structure defined",
-                "Algorithms and data flow planned",
-                "Interfaces designed",
-                "Error handling considered",
-            ),
-        ),
-        BaseTask(
-            name="implement",
-            objective="Implement production-ready code following best practices",
-            description="Write clean, readable, well-structured code that follows language conventions and handles errors properly",
-            prerequisites=("Design completed",),
-            substeps=(
-                "Write clean, readable code",
-                "Follow language best practices",
-                "Add meaningful comments",
-                "Handle exceptions properly",
-            ),
-            sites_to_visit=(
-                "https://peps.python.org/pep-0008/",  # For Python
-                "https://docs.oracle.com/javase/tutorial/java/nutsandbolts/index.html",  # For Java
-                "https://developer.mozilla.org/en-US/docs/Web/JavaScript",  # For JS
-            ),
-            instructions="Implement the code following the design specifications. Add comprehensive error handling, logging, and documentation.",
-            expected_output="Production-ready code implementation",
-            success_criteria=(
-                "Code is clean and readable",
-                "Follows language best practices",
-                "Errors are properly handled",
-                "Code is well-documented",
-            ),
-        ),
-        BaseTask(
-            name="test",
-            objective="Test code thoroughly and ensure quality",
-            description="Write unit tests, test edge cases, error conditions, and verify the implementation meets all requirements",
-            prerequisites=("Code implemented",),
-            substeps=(
-                "Write unit tests for key functions",
-                "Test edge cases and error conditions",
-                "Review code for bugs and optimization",
-                "Suggest improvements",
-            ),
-            instructions="Create comprehensive tests covering normal operation, edge cases, and error conditions. Verify all requirements are met.",
-            expected_output="Thoroughly tested code with identified issues addressed",
-            success_criteria=(
-                "Unit tests written for key functions",
-                "Edge cases and errors tested",
-                "Code reviewed for quality",
-                "Improvement suggestions provided",
-            ),
-        ),
-    ])
+    base_tasks: tuple[BaseTask, ...] = _DEFAULT_BASE_TASKS
 
     # Derived TaskSpec instances (computed from base_tasks)
     @property
     def tasks(self) -> list[TaskSpec]:
         """Convert base_tasks to TaskSpec instances."""
-        return [base_task.to_task_spec() for base_task in self.base_tasks]
+        return [base_task.task_spec for base_task in self.base_tasks]
+
+    def clone(self) -> WorkflowTemplate:
+        """Return a copy with its own, mutable structure mapping."""
+        return replace(self, structure=dict(self.structure or {}))
 
     def __post_init__(self) -> None:
         """Initialize default structure if not provided."""
-        if not self.structure:
+        if self.structure is None:
             self._init_default_structure()
 
     def _init_default_structure(self) -> None:
         """Initialize the default folder structure."""
+        workflow_yaml, steps_config = self._generate_config_files()
         self.structure = {
             # Root config
-            "workflow.yaml": self._generate_workflow_yaml(),
+            "workflow.yaml": workflow_yaml,
             "README.md": self._generate_readme(),
 
             # Memory file
-            "memory.md": "# Workflow Memory\n\nSession memory for workflow execution.",
+            "memory.md": _DEFAULT_MEMORY,
 
             # Memory directory (for additional memory files)
             "memory/": None,
@@ -175,7 +225,7 @@ class WorkflowTemplate:
 
             # Config directory
             "config/": None,
-            "config/steps.yaml": self._generate_steps_config(),
+            "config/steps.yaml": steps_config,
 
             # Logs directory
             "logs/": None,
@@ -183,17 +233,21 @@ class WorkflowTemplate:
             # Results/output directory
             "results/": None,
         }
+        # Encode once here so writing the workflow out is a plain byte copy.
+        self.structure = {
+            path: content.encode("utf-8") if isinstance(content, str) else content
+            for path, content in self.structure.items()
+        }
 
-    def _generate_workflow_yaml(self) -> str:
-        """Generate the main workflow YAML content."""
+    def _generate_config_files(self) -> tuple[bytes, bytes]:
+        """Generate the encoded workflow.yaml and config/steps.yaml contents.
 
-        data = {
-            "goal": self.goal,
-            "memory_file": self.memory_file,
-            "tasks": [task.as_dict() for task in self.tasks],
-            "steps": [step.as_dict() for step in self.steps]
-        }
-        return yaml.safe_dump(data, sort_keys=False, allow_unicode=True)
+        Templates built on the default steps and tasks share one rendering per
+        goal and memory file instead of dumping YAML for every instance.
+        """
+        if self.steps is _DEFAULT_STEPS and self.base_tasks is _DEFAULT_BASE_TASKS:
+            return _render_default_config_files(self.goal, self.memory_file)
+        return _render_config_files(self.goal, self.memory_file, self.steps, self.base_tasks)
 
     def _generate_readme(self) -> str:
         """Generate README content for the workflow."""
@@ -217,55 +271,119 @@ python -m mcp_workflows.cli run {self.name}
 ```
 
 ## Contents
-{chr(10).join(f"- {path}" for path in sorted(self.structure.keys()) if path)}
+{_DEFAULT_PATH_BULLETS}
 """
 
-    def _generate_steps_config(self) -> str:
-        """Generate detailed steps configuration."""
 
-        steps_data = {
-            "description": "Detailed step configuration",
-            "steps": [step.as_dict() for step in self.steps]
-        }
-        return yaml.safe_dump(steps_data, sort_keys=False, allow_unicode=True)
+def _render_config_files(
+    goal: str,
+    memory_file: str,
+    steps: tuple[StepSpec, ...],
+    base_tasks: tuple[BaseTask, ...],
+) -> tuple[bytes, bytes]:
+    """Render workflow.yaml and config/steps.yaml from one set of step payloads."""
+    step_dicts = [step.as_dict() for step in steps]
+    workflow = {
+        "goal": goal,
+        "memory_file": memory_file,
+        "tasks": [base_task.task_spec.as_dict() for base_task in base_tasks],
+        "steps": step_dicts,
+    }
+    steps_config = {
+        "description": "Detailed step configuration",
+        "steps": step_dicts,
+    }
+    return _dump_yaml(workflow).encode("utf-8"), _dump_yaml(steps_config).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=32)
+def _render_default_config_files(goal: str, memory_file: str) -> tuple[bytes, bytes]:
+    """Render the config files for the default steps and tasks once per goal."""
+    return _render_config_files(goal, memory_file, _DEFAULT_STEPS, _DEFAULT_BASE_TASKS)
 
 
-# Predefined templates use default BaseTask instances
-CODE_WORKFLOW_TEMPLATE = WorkflowTemplate(
-    name="code_workflow",
-    goal="Write production-ready code for the specified task",
-    memory_file="memory.md",
+# Directories to create and (path, content) files to write, relative to the
+# workflow folder.
+_WritePlan = tuple[tuple[PurePath, ...], tuple[tuple[str, bytes], ...]]
+
+
+def _plan_writes(structure: Mapping[str, str | bytes | None]) -> _WritePlan:
+    """Split ``structure`` into unique directories and encoded file contents."""
+    # Collect every directory first so each one is created exactly once; the
+    # empty path stands for the workflow folder itself.
+    directories = {PurePath()}
+    files: list[tuple[str, bytes]] = []
+    for path, content in structure.items():
+        if content is None:
+            directories.add(PurePath(path))
+        else:
+            directories.add(PurePath(path).parent)
+            data = content.encode("utf-8") if isinstance(content, str) else content
+            files.append((path, data))
+    return tuple(sorted(directories)), tuple(files)
+
+
+# Write plans of the module's shared read-only templates, keyed by the id of
+# their structure. Each entry keeps its structure alive, so the id cannot be
+# reused by another mapping; every other structure is planned on each call,
+# since a plain dict may be edited in place between calls.
+_SHARED_PLANS: dict[int, tuple[Mapping[str, str | bytes | None], _WritePlan]] = {}
+
+
+def _share(template: WorkflowTemplate) -> WorkflowTemplate:
+    """Make ``template``'s structure read-only and precompute its write plan."""
+    structure = MappingProxyType(dict(template.structure or {}))
+    template.structure = structure
+    _SHARED_PLANS[id(structure)] = (structure, _plan_writes(structure))
+    return template
+
+
+def _write_plan(structure: Mapping[str, str | bytes | None]) -> _WritePlan:
+    """Return the write plan for ``structure``, reusing a shared template's."""
+    shared = _SHARED_PLANS.get(id(structure))
+    if shared is not None:
+        return shared[1]
+    return _plan_writes(structure)
+
+
+# Predefined templates use default BaseTask instances. The shared instance is
+# read-only; use clone() to obtain an editable copy.
+CODE_WORKFLOW_TEMPLATE = _share(
+    WorkflowTemplate(
+        name="code_workflow",
+        goal="Write production-ready code for the specified task",
+        memory_file="memory.md",
+    )
 )
 
+_TEMPLATES: dict[str, WorkflowTemplate] = {
+    "code": CODE_WORKFLOW_TEMPLATE,
+    "code_workflow": CODE_WORKFLOW_TEMPLATE,
+}
 
-def get_template(template_name: str) -> WorkflowTemplate:
-    """Get a template by name."""
-    templates = {
-        "code": CODE_WORKFLOW_TEMPLATE,
-        "code_workflow": CODE_WORKFLOW_TEMPLATE,
-    }
 
-    if template_name not in templates:
-        raise ValueError(f"Unknown template: {template_name}. Available: {list(templates.keys())}")
+def get_template(template_name: str) -> WorkflowTemplate:
+    """Get a template by name.
 
-    return templates[template_name]
+    The returned template is shared and its structure is read-only; call
+    :meth:`WorkflowTemplate.clone` before customizing it.
+    """
+    try:
+        return _TEMPLATES[template_name]
+    except KeyError:
+        msg = f"Unknown template: {template_name}. Available: {list(_TEMPLATES)}"
+        raise ValueError(msg) from None
 
 
 def create_workflow_from_template(template: WorkflowTemplate, base_path: Path) -> Path:
     """Create a complete workflow folder structure from a template."""
     folder_path = base_path / template.name
-    folder_path.mkdir(parents=True, exist_ok=True)
-
-    for path_str, content in template.structure.items():
-        path = folder_path / path_str
 
-        if content is None:
-            # It's a directory
-            path.mkdir(parents=True, exist_ok=True)
-        else:
-            # It's a file
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(content, encoding="utf-8")
+    directories, relative_files = _write_plan(template.structure or {})
+    for directory in directories:
+        (folder_path / directory).mkdir(parents=True, exist_ok=True)
+    for path, content in relative_files:
+        (folder_path / path).write_bytes(content)
 
     return folder_path
 
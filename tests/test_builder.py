@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import copy
+import dataclasses
+import pickle
 from pathlib import Path
 
+import pytest
+import yaml
+
 from mcp_workflows.builder import WorkflowBuilder
-from mcp_workflows.spec import StepKind
+from mcp_workflows.spec import BaseTask, StepKind, StepRequest, StepSpec, WorkflowSpec
 
 
 def test_builder_produces_spec_and_yaml(tmp_path: Path) -> None:
@@ -38,3 +44,106 @@ def test_builder_produces_spec_and_yaml(tmp_path: Path) -> None:
     builder.emit_yaml(output_path)
     contents_second = output_path.read_text(encoding="utf-8")
     assert contents_first == contents_second
+
+
+def test_emit_yaml_keeps_existing_file_on_serialization_error(tmp_path: Path) -> None:
+    """A value YAML cannot represent leaves the previous output untouched."""
+
+    output_path = tmp_path / "workflow.yaml"
+    output_path.write_text("goal: previous\n", encoding="utf-8")
+    builder = (
+        WorkflowBuilder.start()
+        .with_goal("Broken")
+        .memory("memory.md")
+        .add_step("Opaque", config={"value": object()})
+    )
+
+    with pytest.raises(yaml.YAMLError):
+        builder.emit_yaml(output_path)
+    assert output_path.read_text(encoding="utf-8") == "goal: previous\n"
+
+
+def test_compile_is_cached_and_builders_are_immutable() -> None:
+    """Compilation is memoized and configuration methods return new builders."""
+
+    builder = WorkflowBuilder.start().with_goal("Cache").memory("memory.md")
+    first = builder.compile()
+    assert builder.compile() is first
+
+    extended = builder.add_step("Later", doc="Added after compilation")
+    assert builder.compile() is first
+    assert first.steps == ()
+    assert len(extended.compile().steps) == 1
+
+
+def test_add_step_rejects_unknown_tasks() -> None:
+    """Unknown task references are reported together."""
+
+    builder = WorkflowBuilder.start().register_task("known", text="Known task")
+    with pytest.raises(ValueError, match="'missing', 'other'"):
+        builder.add_step("Broken", uses=["known", "other", "missing"])
+
+
+def test_spec_rejects_duplicate_ids_naming_the_offender() -> None:
+    """Duplicate step identifiers are reported with the repeated id."""
+
+    step = StepSpec(id=7, name="Twice", kind=StepKind.LLM)
+    with pytest.raises(ValueError, match="duplicate 7"):
+        WorkflowSpec(goal="Dupes", memory_file="memory.md", steps=(step, step))
+
+
+def test_serialization_caches_stay_out_of_dataclass_fields(tmp_path: Path) -> None:
+    """Emitting a spec or rendering a task adds nothing to fields() or asdict()."""
+
+    builder = WorkflowBuilder.start().with_goal("Fields").memory("memory.md").add_step("Only")
+    builder.emit_yaml(tmp_path / "workflow.yaml")
+    spec = builder.compile()
+    task = BaseTask(name="notes", objective="Take notes", description="Keep notes")
+    assert task.task_spec is task.task_spec
+
+    for value in (spec, spec.steps[0], task):
+        assert not [f.name for f in dataclasses.fields(value) if f.name.startswith("_")]
+        assert not [key for key in dataclasses.asdict(value) if key.startswith("_")]
+
+
+def test_compiled_spec_and_requests_pickle_and_copy() -> None:
+    """Frozen step config survives pickle, deepcopy and dataclasses.asdict."""
+
+    spec = (
+        WorkflowBuilder.start()
+        .with_goal("Portable")
+        .memory("memory.md")
+        .add_step("Tuned", config={"temperature": 0.2})
+        .add_step("Plain")
+        .compile()
+    )
+    request = StepRequest(
+        step_id=1,
+        name="Tuned",
+        kind=StepKind.LLM,
+        correlation_id="step-1",
+        input="",
+        memory_text="",
+        config=spec.steps[0].config,
+    )
+
+    for value in (spec, request):
+        assert pickle.loads(pickle.dumps(value)) == value
+        assert copy.deepcopy(value) == value
+    assert dataclasses.asdict(spec)["steps"][0]["config"] == {"temperature": 0.2}
+    restored = pickle.loads(pickle.dumps(spec)).steps[0].config
+    with pytest.raises(TypeError):
+        restored["temperature"] = 1.0
+
+
+@pytest.mark.parametrize("dumper", [yaml.SafeDumper, getattr(yaml, "CSafeDumper", yaml.SafeDumper)])
+def test_frozen_config_safe_dumps_as_plain_mapping(dumper: type[yaml.SafeDumper]) -> None:
+    """Safe dumpers emit frozen configs and asdict() output like plain data."""
+
+    step = StepSpec(id=1, name="Tuned", kind=StepKind.LLM, config={"temperature": 0.2})
+
+    dumped = yaml.dump({"config": step.config}, Dumper=dumper)
+    assert yaml.safe_load(dumped) == {"config": {"temperature": 0.2}}
+    loaded = yaml.safe_load(yaml.dump(dataclasses.asdict(step), Dumper=dumper))
+    assert loaded["config"] == {"temperature": 0.2}
+    assert loaded["kind"] == "llm"
@@ -75,3 +75,60 @@ def test_missing_registration_raises_value_error() -> None:
     factory = ExecutorFactory()
     with pytest.raises(ValueError):
         factory.create(StepKind.SHELL)
+
+
+def test_clear_singletons_rebuilds_cached_instances() -> None:
+    """Clearing singletons forces the next resolution to rebuild the executor."""
+
+    factory = ExecutorFactory()
+    factory.register_singleton(StepKind.SHELL, lambda _: SampleExecutor())
+    factory.register_instance(StepKind.PYTHON, SampleExecutor())
+    first = factory.create(StepKind.SHELL)
+    factory.container.clear_singletons()
+    assert factory.create(StepKind.SHELL) is not first
+    assert not factory.is_registered(StepKind.PYTHON)
+
+
+def test_register_singleton_defers_construction_until_first_use() -> None:
+    """Singleton registrations build their executor once, on the first request."""
+
+    built: list[SampleExecutor] = []
+
+    def build(_: object) -> SampleExecutor:
+        built.append(SampleExecutor())
+        return built[-1]
+
+    factory = ExecutorFactory()
+    factory.register_singleton(StepKind.SHELL, build)
+    assert built == []
+    first = factory.create(StepKind.SHELL)
+    assert factory.create(StepKind.SHELL) is first
+    assert built == [first]
+
+
+def test_duplicate_registration_requires_override() -> None:
+    """Registering a kind twice fails unless ``override`` is set."""
+
+    factory = ExecutorFactory()
+    original = SampleExecutor()
+    factory.register_instance(StepKind.SHELL, original)
+    with pytest.raises(ValueError, match="already registered"):
+        factory.register_factory(StepKind.SHELL, lambda _: SampleExecutor())
+    assert factory.create(StepKind.SHELL) is original
+
+    replacement = SampleExecutor()
+    factory.register_instance(StepKind.SHELL, replacement, override=True)
+    assert factory.create(StepKind.SHELL) is replacement
+
+
+def test_is_singleton_reports_shared_registrations() -> None:
+    """Only singleton and instance registrations report a shared executor."""
+
+    factory = ExecutorFactory()
+    factory.register_factory(StepKind.SHELL, lambda _: SampleExecutor())
+    factory.register_singleton(StepKind.PYTHON, lambda _: SampleExecutor())
+    factory.register_instance(StepKind.LLM, SampleExecutor())
+
+    assert not factory.is_singleton(StepKind.SHELL)
+    assert factory.is_singleton(StepKind.PYTHON)
+    assert factory.is_singleton(StepKind.LLM)
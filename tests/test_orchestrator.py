@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pytest
+
 from mcp_workflows.builder import WorkflowBuilder
 from mcp_workflows.factories import ExecutorFactory
 from mcp_workflows.orchestrator import WorkflowOrchestrator
@@ -80,3 +82,149 @@ def test_orchestrator_uses_executor_factory_for_new_kinds(tmp_path: Path) -> Non
     orchestrator = WorkflowOrchestrator(spec, executor_factory=factory)
     orchestrator.run()
     assert len(recording.requests) == 1
+
+
+def test_orchestrator_passes_accumulated_memory_to_later_steps(tmp_path: Path) -> None:
+    """Each step sees the memory file plus summaries written by earlier steps."""
+
+    memory_path = tmp_path / "memory.md"
+    memory_path.write_text("# Memory\n", encoding="utf-8")
+    builder = (
+        WorkflowBuilder.start()
+        .with_goal("Accumulate memory")
+        .memory(memory_path)
+        .add_step("First", kind=StepKind.LLM)
+        .add_step("Second", kind=StepKind.LLM)
+        .end()
+    )
+    recording = RecordingExecutor()
+    WorkflowOrchestrator(builder.compile(), executors={StepKind.LLM: recording}).run()
+    assert [request.memory_text for request in recording.requests] == [
+        "# Memory\n",
+        "# Memory\n- First: recorded\n",
+    ]
+    assert memory_path.read_text(encoding="utf-8") == (
+        "# Memory\n- First: recorded\n- Second: recorded\n"
+    )
+
+
+def test_step_config_is_shared_read_only_with_requests(tmp_path: Path) -> None:
+    """Step configuration is frozen once and handed to executors without copying."""
+
+    config = {"temperature": 0.2}
+    spec = (
+        WorkflowBuilder.start()
+        .with_goal("Frozen config")
+        .memory(tmp_path / "memory.md")
+        .add_step("Demo", kind=StepKind.LLM, config=config)
+        .compile()
+    )
+    config["temperature"] = 1.0
+    recording = RecordingExecutor()
+    WorkflowOrchestrator(spec, executors={StepKind.LLM: recording}).run()
+    request_config = recording.requests[0].config
+    assert request_config is spec.steps[0].config
+    assert dict(request_config) == {"temperature": 0.2}
+    with pytest.raises(TypeError):
+        request_config["temperature"] = 0.5  # type: ignore[index]
+
+
+class RecordingObserver:
+    """Observer double recording lifecycle notifications."""
+
+    def __init__(self) -> None:
+        self.events: list[tuple[str, str]] = []
+
+    def on_step_start(self, request: StepRequest) -> None:
+        self.events.append(("start", request.name))
+
+    def on_step_finish(self, request: StepRequest, _response: StepResponse) -> None:
+        self.events.append(("finish", request.name))
+
+    def on_step_error(self, request: StepRequest, _response: StepResponse) -> None:
+        self.events.append(("error", request.name))
+
+
+class FailingExecutor:
+    """Executor double that always reports failure."""
+
+    def execute(self, _request: StepRequest) -> StepResponse:
+        return StepResponse(status="fail", error="boom")
+
+
+def test_orchestrator_notifies_observer_and_stops_on_failure(tmp_path: Path) -> None:
+    """Observers see start/finish/error events and execution halts on failure."""
+
+    memory_path = tmp_path / "memory.md"
+    spec = (
+        WorkflowBuilder.start()
+        .with_goal("Observe")
+        .memory(memory_path)
+        .add_step("Ok", kind=StepKind.LLM)
+        .add_step("Broken", kind=StepKind.SHELL)
+        .add_step("Skipped", kind=StepKind.LLM)
+        .compile()
+    )
+    observer = RecordingObserver()
+    orchestrator = WorkflowOrchestrator(
+        spec, observer=observer, executors={StepKind.SHELL: FailingExecutor()}
+    )
+    responses = orchestrator.run()
+    assert [response.status for response in responses] == ["ok", "fail"]
+    assert observer.events == [
+        ("start", "Ok"),
+        ("finish", "Ok"),
+        ("start", "Broken"),
+        ("error", "Broken"),
+    ]
+    assert "- Broken: failed (boom)" in memory_path.read_text(encoding="utf-8")
+
+
+def test_observer_assigned_after_construction_is_notified(tmp_path: Path) -> None:
+    """Reassigning the observer attribute rebinds the lifecycle callbacks."""
+
+    spec = (
+        WorkflowBuilder.start()
+        .with_goal("Observe later")
+        .memory(tmp_path / "memory.md")
+        .add_step("Only")
+        .compile()
+    )
+    orchestrator = WorkflowOrchestrator(spec)
+    observer = RecordingObserver()
+
+    orchestrator.observer = observer
+    orchestrator.run()
+    orchestrator.observer = None
+    orchestrator.run()
+
+    assert orchestrator.observer is None
+    assert observer.events == [("start", "Only"), ("finish", "Only")]
+
+
+def test_orchestrator_resolves_executors_lazily_per_registration(tmp_path: Path) -> None:
+    """Factory kinds get a fresh executor per step; unreached kinds are never resolved."""
+
+    spec = (
+        WorkflowBuilder.start()
+        .with_goal("Resolve lazily")
+        .memory(tmp_path / "memory.md")
+        .add_step("First", kind=StepKind.SHELL)
+        .add_step("Second", kind=StepKind.SHELL)
+        .add_step("Broken", kind=StepKind.LLM)
+        .add_step("Unregistered", kind=StepKind.PYTHON)
+        .compile()
+    )
+    created: list[RecordingExecutor] = []
+
+    def build(_: object) -> RecordingExecutor:
+        created.append(RecordingExecutor())
+        return created[-1]
+
+    factory = ExecutorFactory()
+    factory.register_factory(StepKind.SHELL, build)
+    factory.register_instance(StepKind.LLM, FailingExecutor())
+    responses = WorkflowOrchestrator(spec, executor_factory=factory).run()
+
+    assert [response.status for response in responses] == ["ok", "ok", "fail"]
+    assert [len(executor.requests) for executor in created] == [1, 1]
@@ -0,0 +1,189 @@
+"""Workflow template tests."""
+
+from __future__ import annotations
+
+import math
+from datetime import date
+from typing import TYPE_CHECKING, Any
+
+import pytest
+import yaml
+
+from mcp_workflows.spec import StepKind, StepSpec
+from mcp_workflows.templates import (
+    WorkflowTemplate,
+    create_workflow_from_template,
+    get_template,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def test_default_templates_share_rendered_config_files() -> None:
+    """Templates on the default steps and tasks reuse one YAML rendering per goal."""
+
+    first, second = WorkflowTemplate("first"), WorkflowTemplate("second")
+    assert first.structure["workflow.yaml"] is second.structure["workflow.yaml"]
+    assert first.structure["config/steps.yaml"] is second.structure["config/steps.yaml"]
+    assert first.structure["workflow.yaml"] is get_template("code").structure["workflow.yaml"]
+
+    other = WorkflowTemplate("other", goal="Ship the feature")
+    assert b"goal: Ship the feature" in other.structure["workflow.yaml"]
+    assert other.structure["workflow.yaml"] is not first.structure["workflow.yaml"]
+
+
+def test_custom_base_tasks_are_rendered_into_workflow_yaml() -> None:
+    """Templates with their own base tasks list exactly those tasks."""
+
+    template = WorkflowTemplate("tasks", base_tasks=get_template("code").base_tasks[:1])
+    workflow = yaml.safe_load(template.structure["workflow.yaml"])
+
+    assert [task["id"] for task in workflow["tasks"]] == ["requirements"]
+    assert template.tasks[0] is get_template("code").tasks[0]
+
+
+def test_create_workflow_from_template_writes_structure(tmp_path: Path) -> None:
+    """Every directory and file in the structure is materialized."""
+
+    template = WorkflowTemplate(
+        "custom",
+        structure={"logs/": None, "config/steps.yaml": "steps: []\n", "notes/a/b.md": "# b\n"},
+    )
+
+    folder = create_workflow_from_template(template, tmp_path)
+
+    assert folder == tmp_path / "custom"
+    assert (folder / "logs").is_dir()
+    assert (folder / "config" / "steps.yaml").read_text(encoding="utf-8") == "steps: []\n"
+    assert (folder / "notes" / "a" / "b.md").read_text(encoding="utf-8") == "# b\n"
+
+
+def test_default_structure_is_pre_encoded(tmp_path: Path) -> None:
+    """Generated files are stored as UTF-8 bytes and written verbatim."""
+
+    template = WorkflowTemplate("encoded")
+    workflow_yaml = template.structure["workflow.yaml"]
+    assert isinstance(workflow_yaml, bytes)
+
+    folder = create_workflow_from_template(template, tmp_path)
+
+    assert (folder / "workflow.yaml").read_bytes() == workflow_yaml
+
+
+def test_shared_template_is_read_only_until_cloned() -> None:
+    """The predefined template cannot be edited in place; clones can."""
+
+    shared = get_template("code")
+    with pytest.raises(TypeError):
+        shared.structure["extra.md"] = b""
+
+    copy = shared.clone()
+    copy.structure["extra.md"] = b"# extra\n"
+
+    assert "extra.md" not in shared.structure
+    assert copy.structure["workflow.yaml"] == shared.structure["workflow.yaml"]
+
+
+def test_default_readme_lists_every_structure_path() -> None:
+    """The README contents section covers the full default structure."""
+
+    template = WorkflowTemplate("listed")
+    readme = template.structure["README.md"].decode("utf-8")
+    contents = readme.split("## Contents\n", 1)[1].splitlines()
+
+    assert contents == [f"- {path}" for path in sorted(template.structure)]
+
+
+def test_public_serialization_cannot_leak_into_shared_caches() -> None:
+    """Editing dicts returned to callers never changes later generated files."""
+
+    template = WorkflowTemplate("a")
+    template.steps[0].as_dict()["doc"] = "Tampered"
+    template.base_tasks[0].task_spec.as_dict()["text"] = "Tampered"
+
+    assert b"Tampered" not in WorkflowTemplate("b").structure["workflow.yaml"]
+
+
+def test_get_template_rejects_unknown_names() -> None:
+    """Unknown template names list the available choices."""
+
+    assert get_template("code_workflow") is get_template("code")
+    with pytest.raises(ValueError, match="Available: \\['code', 'code_workflow'\\]"):
+        get_template("missing")
+
+
+def test_templates_share_default_definitions() -> None:
+    """Default steps and tasks are shared tuples rather than per-instance lists."""
+
+    first, second = WorkflowTemplate("first"), WorkflowTemplate("second")
+
+    assert first.steps is second.steps
+    assert first.base_tasks is second.base_tasks
+    assert isinstance(first.steps, tuple)
+
+
+def test_explicit_empty_structure_is_kept() -> None:
+    """Only an omitted structure triggers generation of the default layout."""
+
+    assert WorkflowTemplate("empty", structure={}).structure == {}
+    assert "workflow.yaml" in WorkflowTemplate("default").structure
+
+
+def test_shared_template_writes_and_clones_pick_up_edits(tmp_path: Path) -> None:
+    """The shared template writes its files; editable clones see in-place edits."""
+
+    shared = get_template("code")
+    shared_folder = create_workflow_from_template(shared, tmp_path / "shared")
+    for path, content in shared.structure.items():
+        if content is not None:
+            assert (shared_folder / path).read_bytes() == content
+
+    copy = shared.clone()
+    create_workflow_from_template(copy, tmp_path)
+    copy.structure["notes/extra.md"] = b"# extra\n"
+    folder = create_workflow_from_template(copy, tmp_path)
+
+    assert (folder / "notes" / "extra.md").read_bytes() == b"# extra\n"
+    assert (folder / "config" / "steps.yaml").exists()
+
+
+def test_templates_share_rendered_task_specs() -> None:
+    """Templates built on the same base tasks reuse each rendered TaskSpec."""
+
+    first, second = WorkflowTemplate("first"), WorkflowTemplate("second")
+
+    assert first.tasks[0] is second.tasks[0]
+    assert first.base_tasks[0].to_task_spec() is first.tasks[0]
+    assert first.tasks[0].text.startswith("# requirements\n## Objective")
+
+
+@pytest.mark.parametrize(
+    ("doc", "config"),
+    [
+        ("plain", {}),
+        ("del \x7f c1 \x80 nel \x85 ls \u2028 ok é 😀", {}),
+        ("numbers", {"small": 1e-05, "large": 1e20, "ratio": 0.5, "count": 3}),
+        ("int keys", {1: "k", 2: "v"}),
+        ("dates", {"since": date(2024, 1, 1)}),
+    ],
+)
+def test_steps_config_round_trips_through_yaml(doc: str, config: dict[Any, Any]) -> None:
+    """config/steps.yaml loads back the same steps as workflow.yaml."""
+
+    step = StepSpec(id=1, name="Only", kind=StepKind.LLM, doc=doc, config=config)
+    template = WorkflowTemplate("config", steps=(step,))
+    steps = yaml.safe_load(template.structure["config/steps.yaml"])["steps"]
+
+    assert steps == [step.as_dict()]
+    assert steps == yaml.safe_load(template.structure["workflow.yaml"])["steps"]
+
+
+def test_steps_config_keeps_nan_as_float() -> None:
+    """Non-finite floats stay floats rather than loading back as strings."""
+
+    step = StepSpec(id=1, name="Only", kind=StepKind.LLM, config={"score": math.nan})
+    template = WorkflowTemplate("nan", steps=(step,))
+    steps = yaml.safe_load(template.structure["config/steps.yaml"])["steps"]
+
+    assert math.isnan(steps[0]["config"]["score"])